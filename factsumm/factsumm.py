@@ -1,16 +1,17 @@
 import logging
 import os
-from itertools import permutations
+import sys
+from itertools import chain, permutations
 from typing import Dict, List, Set, Tuple, Union
 
+import numpy as np
 import pysbd
-from rich import print
 from sumeval.metrics.rouge import RougeCalculator
 
 from factsumm.utils.module_entity import load_ie, load_ner, load_rel
 from factsumm.utils.module_question import load_qa, load_qg
 from factsumm.utils.module_sentence import load_bert_score
-from factsumm.utils.utils import Config, qags_score
+from factsumm.utils.utils import Config, get_torch_dtype, qags_score, rouge_l_score, rouge_n_score, split_by_lengths
 
 
 class FactSumm:
@@ -21,6 +22,9 @@ class FactSumm:
         qg_model: str = None,
         qa_model: str = None,
         bert_score_model: str = None,
+        use_rich: bool = False,
+        half_precision: bool = False,
+        compile_models: bool = False,
     ):
         """
         FactSumm object used to calculate Factual Consistency score of Abstractive Summarization model
@@ -31,11 +35,25 @@ class FactSumm:
             qg_model (str, optional): QA model to be used (HuggingFace). Defaults to None.
             qa_model (str, optional): QG model to be used (HuggingFace). Defaults to None.
             bert_score_model (str, optional): BERTScore model to be used (HuggingFace). Defaults to None.
+            use_rich (bool, optional): render verbose reports with rich instead of plain stdout. Defaults to False.
+            half_precision (bool, optional): load HuggingFace models in fp16/bf16 on CUDA devices. Defaults to False.
+            compile_models (bool, optional): compile HuggingFace models with `torch.compile`. Defaults to False.
 
         """
         self.config = Config()
         self.segmenter = pysbd.Segmenter(language="en", clean=False)
         self.rouge = RougeCalculator(stopwords=True, lang="en")
+        self.use_rich = use_rich
+        self.half_precision = half_precision
+        self.compile_models = compile_models
+
+        # segmented lines keyed by input text, evicted in insertion order once full
+        self._segment_cache: Dict[str, Tuple[str, ...]] = dict()
+        self._segment_cache_size = 4096
+
+        # ROUGE tokens keyed by (text, is_reference), evicted the same way as segmented lines
+        self._token_cache: Dict[Tuple[str, bool], Tuple[str, ...]] = dict()
+        self._token_cache_size = 4096
 
         # NER, RE, QG, QA models supported by HuggingFace can be used (default can be found in `config.py`)
         self.ner = ner_model if ner_model is not None else self.config.NER_MODEL
@@ -66,7 +84,9 @@ class FactSumm:
         total_perms = list()
 
         for line, line_entities in zip(lines, total_entities):
-            line_perms = list(permutations(line_entities, 2))
+            if len(line_entities) < 2:
+                total_perms.append([])
+                continue
 
             line_perms = [
                 {
@@ -76,7 +96,7 @@ class FactSumm:
                         (comb[-1]["start"], comb[-1]["end"]),
                     ],
                 }
-                for comb in line_perms
+                for comb in permutations(line_entities, 2)
             ]
 
             total_perms.append(line_perms)
@@ -96,12 +116,14 @@ class FactSumm:
 
         """
         perms = self.build_perm(lines, entities)
-        triples = list()
 
-        for perm in perms:
-            triples.extend(self.rel(perm))
+        # pool the permutations of every line into a single batched RE call
+        total_perms = list(chain.from_iterable(perms))
+        if not total_perms:
+            return set()
 
-        return set(triples)
+        # interned strings hash once and compare by identity in the later set operations
+        return {tuple(sys.intern(element) for element in triple) for triple in self.rel(total_perms)}
 
     def _segment(self, text: str) -> List[str]:
         """
@@ -114,19 +136,116 @@ class FactSumm:
             List[str]: list of segmented lines
 
         """
-        return [line.strip() for line in self.segmenter.segment(text)]
+        lines = self._segment_cache.get(text)
+
+        if lines is None:
+            lines = tuple(line.strip() for line in self.segmenter.segment(text))
+
+            if len(self._segment_cache) >= self._segment_cache_size:
+                self._segment_cache.pop(next(iter(self._segment_cache)))
+            self._segment_cache[text] = lines
+
+        return list(lines)
+
+    def _tokenize(self, text: str, is_reference: bool = False) -> Tuple[str, ...]:
+        """
+        Tokenize text for ROUGE calculation
+
+        Args:
+            text (str): text to be tokenized
+            is_reference (bool, optional): whether text is used as reference. Defaults to False.
+
+        Returns:
+            Tuple[str, ...]: tuple of tokens
+
+        """
+        key = (text, is_reference)
+        tokens = self._token_cache.get(key)
+
+        if tokens is None:
+            tokens = tuple(self.rouge.tokenize(text, is_reference))
+
+            if len(self._token_cache) >= self._token_cache_size:
+                self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[key] = tokens
+
+        return tokens
+
+    def _load_models(
+        self,
+        device: str = "cpu",
+        ner: bool = False,
+        rel: bool = False,
+        qg: bool = False,
+        qa: bool = False,
+        bert_score: bool = False,
+        ie: bool = False,
+    ):
+        """
+        Lazily load the requested models which are not loaded yet
+
+        Args:
+            device (str, optional): device info. Defaults to "cpu".
+            ner (bool, optional): load NER model. Defaults to False.
+            rel (bool, optional): load RE model. Defaults to False.
+            qg (bool, optional): load QG model. Defaults to False.
+            qa (bool, optional): load QA model. Defaults to False.
+            bert_score (bool, optional): load BERTScore model. Defaults to False.
+            ie (bool, optional): load OpenIE annotator. Defaults to False.
+
+        """
+        dtype = get_torch_dtype(device, self.half_precision)
+
+        # pipeline postprocessing calls `.numpy()` on the logits, which numpy cannot do for bfloat16
+        pipeline_dtype = get_torch_dtype(device, self.half_precision, allow_bfloat16=False)
+
+        if ner and isinstance(self.ner, str):
+            self.ner = load_ner(self.ner, device, dtype=pipeline_dtype, compile_model=self.compile_models)
+
+        if rel and isinstance(self.rel, str):
+            self.rel = load_rel(self.rel, device, dtype=dtype, compile_model=self.compile_models)
+
+        if qg and isinstance(self.qg, str):
+            self.qg = load_qg(self.qg, device, dtype=dtype, compile_model=self.compile_models)
+
+        if qa and isinstance(self.qa, str):
+            self.qa = load_qa(self.qa, device, dtype=pipeline_dtype, compile_model=self.compile_models)
+
+        if bert_score and isinstance(self.bert_score, str):
+            self.bert_score = load_bert_score(self.bert_score, device)
+
+        if ie and self.ie is None:
+            self.ie = load_ie()
+
+    def _write(self, lines: List[str]):
+        """
+        Write verbose report lines with a single buffered call
+
+        Args:
+            lines (List[str]): lines to be written
+
+        """
+        text = "\n".join(lines) + "\n"
+
+        if self.use_rich:
+            from rich import print
+            print(text, end="")
+        else:
+            sys.stdout.write(text)
 
     def _print_entities(self, mode: str, total_entities: List[List[Dict]]):
-        print(f"{mode.upper()} Entities")
+        lines = [f"{mode.upper()} Entities"]
         for i, line_entities in enumerate(total_entities):
-            print(f'{i+1}: {[(entity["word"], entity["entity"]) for entity in line_entities]}')
-        print()
+            lines.append(f'{i+1}: {[(entity["word"], entity["entity"]) for entity in line_entities]}')
+        lines.append("")
+        self._write(lines)
 
     def calculate_rouge(
         self,
         source: str,
         summary: str,
         verbose: bool = False,
+        source_lines: List[str] = None,
     ) -> Tuple[float, float, float]:
         """
         Calculate ROUGE score
@@ -134,27 +253,34 @@ class FactSumm:
         Args:
             source (str): original source
             summary (str): generated summary
+            verbose (bool, optional): print verbose option. Defaults to False.
+            source_lines (List[str], optional): pre-segmented source lines. Defaults to None.
 
         Returns:
             Tuple: (ROUGE-1, ROUGE-2, ROUGE-L) tuple
 
         """
-        source_lines = self._segment(source)
+        if source_lines is None:
+            source_lines = self._segment(source)
+
+        # tokenize once and let every ROUGE variant reuse the (cached) tokens
+        summary_tokens = self._tokenize(summary)
+        source_tokens = [self._tokenize(line, True) for line in source_lines]
 
-        rouge_1 = self.rouge.rouge_n(summary, source_lines, 1)
-        rouge_2 = self.rouge.rouge_n(summary, source_lines, 2)
-        rouge_l = self.rouge.rouge_l(summary, source_lines)
+        rouge_1 = rouge_n_score(summary_tokens, source_tokens, 1)
+        rouge_2 = rouge_n_score(summary_tokens, source_tokens, 2)
+        rouge_l = rouge_l_score(summary_tokens, source_tokens)
 
         if verbose:
-            print(f"Avg. ROUGE-1: {rouge_1}\nAvg. ROUGE-2: {rouge_2}\nAvg. ROUGE-L: {rouge_l}")
+            self._write([f"Avg. ROUGE-1: {rouge_1}", f"Avg. ROUGE-2: {rouge_2}", f"Avg. ROUGE-L: {rouge_l}"])
 
         return rouge_1, rouge_2, rouge_l
 
     def _print_facts(self, mode: str, facts: Set[Tuple]):
-        print(f"{mode.upper()} Facts")
-        for fact in facts:
-            print(fact)
-        print()
+        lines = [f"{mode.upper()} Facts"]
+        lines.extend(str(fact) for fact in facts)
+        lines.append("")
+        self._write(lines)
 
     def _filter_out(self, sources: Set, summaries: Set) -> Tuple[Set, Set]:
         """
@@ -168,6 +294,9 @@ class FactSumm:
             Tuple[Set, Set]: filtered sources and summaries
 
         """
+        if not sources or not summaries:
+            return set(), set()
+
         source_tuple = {(source[0], source[1]) for source in sources}
         summary_tuple = {(summary[0], summary[1]) for summary in summaries}
 
@@ -183,6 +312,10 @@ class FactSumm:
         summary: str,
         verbose: bool = False,
         device: str = "cpu",
+        source_lines: List[str] = None,
+        summary_lines: List[str] = None,
+        source_ents: List = None,
+        summary_ents: List = None,
     ):
         """
         Extract (head_entity, relation, tail_entity) relation triple using NER & RE module
@@ -194,18 +327,25 @@ class FactSumm:
             summary (str): generated summary
             verbose (bool, optional): print verbose option. Defaults to False.
             device (str): device info
+            source_lines (List[str], optional): pre-segmented source lines. Defaults to None.
+            summary_lines (List[str], optional): pre-segmented summary lines. Defaults to None.
+            source_ents (List, optional): named entities extracted from source. Defaults to None.
+            summary_ents (List, optional): named entities extracted from summary. Defaults to None.
 
         """
-        if isinstance(self.ner, str) and isinstance(self.rel, str):
-            self.ner = load_ner(self.ner, device)
-            self.rel = load_rel(self.rel, device)
+        self._load_models(device, ner=True, rel=True)
+
+        if source_lines is None:
+            source_lines = self._segment(source)
 
-        source_lines = self._segment(source)
-        summary_lines = self._segment(summary)
+        if summary_lines is None:
+            summary_lines = self._segment(summary)
 
-        # extract per-line entities
-        source_ents = self.ner(source_lines)
-        summary_ents = self.ner(summary_lines)
+        if source_ents is None or summary_ents is None:
+            # extract per-line entities in a single batched pass over both documents
+            total_ents = self.ner(source_lines + summary_lines)
+            source_ents = total_ents[:len(source_lines)]
+            summary_ents = total_ents[len(source_lines):]
 
         # extract entity-based triple: (head, relation, tail)
         source_facts = self.get_facts(source_lines, source_ents)
@@ -236,15 +376,16 @@ class FactSumm:
             fact_score = len(common_facts) / len(summary_facts)
 
         if verbose:
-            print(f"Fact Score: {fact_score}")
+            self._write([f"Fact Score: {fact_score}"])
 
         return source_ents, summary_ents, fact_score
 
     def _print_qas(self, mode: str, questions: List[Dict]):
-        print(f"Answers based on {mode.upper()} (Questions are generated from Summary)")
+        lines = [f"Answers based on {mode.upper()} (Questions are generated from Summary)"]
         for question in questions:
-            print(f"[Q] {question['question']}\t[Pred] {question['prediction']}")
-        print()
+            lines.append(f"[Q] {question['question']}\t[Pred] {question['prediction']}")
+        lines.append("")
+        self._write(lines)
 
     def extract_qas(
         self,
@@ -254,6 +395,10 @@ class FactSumm:
         summary_ents: List = None,
         verbose: bool = False,
         device: str = "cpu",
+        summary_lines: List[str] = None,
+        summary_qas: List[Dict] = None,
+        source_answers: List[Dict] = None,
+        summary_answers: List[Dict] = None,
     ) -> float:
         """
         Extract Question & Answering Pair generated from Question Generation module
@@ -267,28 +412,34 @@ class FactSumm:
             summary_ents (List, optional): named entities extracted from source. Defaults to None.
             verbose (bool, optional): print verbose option. Defaults to False.
             device (str): device info
+            summary_lines (List[str], optional): pre-segmented summary lines. Defaults to None.
+            summary_qas (List[Dict], optional): questions generated from summary. Defaults to None.
+            source_answers (List[Dict], optional): answers predicted from source. Defaults to None.
+            summary_answers (List[Dict], optional): answers predicted from summary. Defaults to None.
 
         """
-        if isinstance(self.qg, str) and isinstance(self.qa, str):
-            self.qg = load_qg(self.qg, device)
-            self.qa = load_qa(self.qa, device)
-
-        if isinstance(self.ner, str):
-            self.ner = load_ner(self.ner, device)
+        if source_answers is None or summary_answers is None:
+            if summary_qas is None:
+                self._load_models(device, ner=summary_ents is None, qg=True)
 
-        source_lines = self._segment(source)
-        summary_lines = self._segment(summary)
+                if summary_lines is None:
+                    summary_lines = self._segment(summary)
 
-        if source_ents is None:
-            source_ents = self.ner(source_lines)
+                # only summary entities are needed to generate questions
+                if summary_ents is None:
+                    summary_ents = self.ner(summary_lines)
 
-        if summary_ents is None:
-            summary_ents = self.ner(summary_lines)
+                summary_qas = self.qg(summary_lines, summary_ents)
 
-        summary_qas = self.qg(summary_lines, summary_ents)
+            self._load_models(device, qa=True)
 
-        source_answers = self.qa(source, summary_qas)
-        summary_answers = self.qa(summary, summary_qas)
+            # answer against both contexts in one batched QA call
+            total_answers = self.qa(
+                [source] * len(summary_qas) + [summary] * len(summary_qas),
+                summary_qas + summary_qas,
+            )
+            source_answers = total_answers[:len(summary_qas)]
+            summary_answers = total_answers[len(summary_qas):]
 
         if verbose:
             self._print_qas("source", source_answers)
@@ -296,46 +447,63 @@ class FactSumm:
 
         qa_score = qags_score(source_answers, summary_answers)
         if verbose:
-            print(f"QAGS Score: {qa_score}\n")
+            self._write([f"QAGS Score: {qa_score}", ""])
 
         return qa_score
 
     def _print_triples(self, mode: str, triples: Set):
-        print(f"{mode.upper()} Triples")
-        for triple in triples:
-            print(triple)
-        print()
+        lines = [f"{mode.upper()} Triples"]
+        lines.extend(str(triple) for triple in triples)
+        lines.append("")
+        self._write(lines)
 
-    def extract_triples(self, source: str, summary: str, verbose: bool = False):
+    def _extract_ie_triples(self, text: str) -> Set[Tuple]:
         """
-        Extract OpenIE based fact triples
+        Extract (subject, relation, object) triples from text using OpenIE
 
         Args:
-            source (str): original source
-            summary (str): generated summary
-            verbose (bool, optional): print verbose option. Defaults to False.
+            text (str): text to be annotated
+
+        Returns:
+            Set[Tuple]: set of interned triples
 
         """
-        if self.ie is None:
-            self.ie = load_ie()
+        self._load_models(ie=True)
 
-        source_triples = {
+        return {
             (
-                triple["subject"],
-                triple["relation"],
-                triple["object"],
+                sys.intern(triple["subject"]),
+                sys.intern(triple["relation"]),
+                sys.intern(triple["object"]),
             )
-            for triple in self.ie(source)
+            for triple in self.ie(text)
         }
 
-        summary_triples = {
-            (
-                triple["subject"],
-                triple["relation"],
-                triple["object"],
-            )
-            for triple in self.ie(summary)
-        }
+    def extract_triples(
+        self,
+        source: str,
+        summary: str,
+        verbose: bool = False,
+        source_triples: Set[Tuple] = None,
+        summary_triples: Set[Tuple] = None,
+    ):
+        """
+        Extract OpenIE based fact triples
+
+        Args:
+            source (str): original source
+            summary (str): generated summary
+            verbose (bool, optional): print verbose option. Defaults to False.
+            source_triples (Set[Tuple], optional): pre-extracted source triples. Defaults to None.
+            summary_triples (Set[Tuple], optional): pre-extracted summary triples. Defaults to None.
+
+        """
+        if summary_triples is None:
+            summary_triples = self._extract_ie_triples(summary)
+
+        # without summary triples nothing can match, so skip OpenIE over the (usually longer) source
+        if source_triples is None:
+            source_triples = self._extract_ie_triples(source) if summary_triples else set()
 
         source_triples, summary_triples = self._filter_out(
             source_triples,
@@ -354,16 +522,25 @@ class FactSumm:
             triple_score = len(common_triples) / len(summary_triples)
 
         if verbose:
-            print(f"Triple Score: {triple_score}\n")
+            self._write([f"Triple Score: {triple_score}", ""])
 
         return triple_score
 
+    def _print_bert_score(self, scores: List[float]):
+        self._write([
+            "BERTScore Score",
+            f"Precision: {scores[0]}",
+            f"Recall: {scores[1]}",
+            f"F1: {scores[2]}",
+        ])
+
     def calculate_bert_score(
         self,
         source: str,
         summary: str,
         verbose: bool = False,
         device: str = "cpu",
+        source_lines: List[str] = None,
     ) -> List[float]:
         """
         Calculate BERTScore
@@ -373,33 +550,26 @@ class FactSumm:
         Args:
             source (str): original source
             summary (str): generated summary
+            verbose (bool, optional): print verbose option. Defaults to False.
             device (str): device info
+            source_lines (List[str], optional): pre-segmented source lines. Defaults to None.
 
         Returns:
             List: (Precision, Recall, F1) BERTScore list
 
         """
-        if isinstance(self.bert_score, str):
-            self.bert_score = load_bert_score(self.bert_score, device)
-
-        # BUG: When len(source_lines) == 1, bmm error raises
-        source_lines = self._segment(source)
-        summary_lines = [summary, "dummy"]
+        self._load_models(device, bert_score=True)
 
-        scores = self.bert_score(summary_lines, source_lines)
-        filtered_scores = list()
+        if source_lines is None:
+            source_lines = self._segment(source)
 
-        for score in scores:
-            score = score.tolist()
-            score.pop(-1)
-            filtered_scores.append(sum(score) / len(score))
+        precision, recall, f1 = self.bert_score([summary], [source_lines])
+        scores = [precision[0], recall[0], f1[0]]
 
         if verbose:
-            print(
-                f"BERTScore Score\nPrecision: {filtered_scores[0]}\nRecall: {filtered_scores[1]}\nF1: {filtered_scores[2]}"
-            )
+            self._print_bert_score(scores)
 
-        return filtered_scores
+        return scores
 
     def __call__(
         self,
@@ -419,56 +589,120 @@ class FactSumm:
 
         num_pairs = len(sources)
 
-        fact_scores = 0
-        qags_scores = 0
-        triple_scores = 0
-        rouges = [0, 0, 0]
-        bert_scores = [0, 0, 0]
+        # per-pair scores are written by index and reduced once at the end
+        fact_scores = np.zeros(num_pairs)
+        qags_scores = np.zeros(num_pairs)
+        triple_scores = np.zeros(num_pairs)
+        rouges = np.zeros((num_pairs, 3))
+        bert_scores = np.zeros((num_pairs, 3))
+
+        self._load_models(device, ner=True, rel=True, qg=True, qa=True, bert_score=True, ie=True)
+
+        # segment every document once and share the lines across every metric
+        source_lines = [self._segment(source) for source in sources]
+        summary_lines = [self._segment(summary) for summary in summaries]
+
+        # run NER once over the lines of every pair, then scatter entities back per document
+        total_lines = source_lines + summary_lines
+        total_ents = split_by_lengths(
+            self.ner(list(chain.from_iterable(total_lines))),
+            [len(lines) for lines in total_lines],
+        )
+        source_ents = total_ents[:num_pairs]
+        summary_ents = total_ents[num_pairs:]
+
+        # generate questions for every summary at once; QG yields one question per entity
+        summary_qas = split_by_lengths(
+            self.qg(
+                list(chain.from_iterable(summary_lines)),
+                list(chain.from_iterable(summary_ents)),
+            ),
+            [sum(len(line_ents) for line_ents in ents) for ents in summary_ents],
+        )
+
+        # answer the questions of every pair against its source and its summary in a single QA call
+        qa_contexts = list()
+        qa_pairs = list()
+
+        for source, summary, qas in zip(sources, summaries, summary_qas):
+            qa_contexts.extend([source] * len(qas) + [summary] * len(qas))
+            qa_pairs.extend(qas + qas)
+
+        total_answers = split_by_lengths(
+            self.qa(qa_contexts, qa_pairs),
+            [2 * len(qas) for qas in summary_qas],
+        )
+        source_answers = [answers[:len(answers) // 2] for answers in total_answers]
+        summary_answers = [answers[len(answers) // 2:] for answers in total_answers]
+
+        # score every summary against its own source lines in a single BERTScore call
+        bert_scores[:] = np.column_stack(self.bert_score(summaries, source_lines))
+
+        # run OpenIE once per distinct text; sources are only annotated when their summary yields any triple
+        total_triples = dict()
+        for summary in summaries:
+            if summary not in total_triples:
+                total_triples[summary] = self._extract_ie_triples(summary)
 
         for source, summary in zip(sources, summaries):
-            source_ents, summary_ents, fact_score = self.extract_facts(
+            if total_triples[summary] and source not in total_triples:
+                total_triples[source] = self._extract_ie_triples(source)
+
+        # pairs are scored serially: the shared HF fast tokenizers and models are not thread-safe
+        for i, (source, summary) in enumerate(zip(sources, summaries)):
+            _, _, fact_scores[i] = self.extract_facts(
                 source,
                 summary,
                 verbose,
                 device,
+                source_lines[i],
+                summary_lines[i],
+                source_ents[i],
+                summary_ents[i],
             )
-            fact_scores += fact_score
 
-            qags_score = self.extract_qas(
+            qags_scores[i] = self.extract_qas(
                 source,
                 summary,
-                source_ents,
-                summary_ents,
+                source_ents[i],
+                summary_ents[i],
                 verbose,
                 device,
+                summary_lines[i],
+                summary_qas[i],
+                source_answers[i],
+                summary_answers[i],
             )
-            qags_scores += qags_score
 
-            triple_score = self.extract_triples(source, summary, verbose)
-            triple_scores += triple_score
+            triple_scores[i] = self.extract_triples(
+                source,
+                summary,
+                verbose,
+                total_triples.get(source, set()),
+                total_triples[summary],
+            )
 
-            rouge_1, rouge_2, rouge_l = self.calculate_rouge(source, summary, verbose)
-            rouges[0] += rouge_1
-            rouges[1] += rouge_2
-            rouges[2] += rouge_l
+            rouges[i] = self.calculate_rouge(
+                source,
+                summary,
+                verbose,
+                source_lines[i],
+            )
+
+            if verbose:
+                self._print_bert_score(bert_scores[i].tolist())
 
-            bert_score = self.calculate_bert_score(source, summary, verbose, device)
-            bert_scores[0] += bert_score[0]
-            bert_scores[1] += bert_score[1]
-            bert_scores[2] += bert_score[2]
+        rouge = rouges.mean(axis=0).tolist()
+        bert_score = bert_scores.mean(axis=0).tolist()
 
         return {
-            "fact_score": fact_scores / num_pairs,
-            "qa_score": qags_scores / num_pairs,
-            "triple_score": triple_scores / num_pairs,
-            "rouge": (
-                rouges[0] / num_pairs,
-                rouges[1] / num_pairs,
-                rouges[2] / num_pairs,
-            ),
+            "fact_score": float(fact_scores.mean()),
+            "qa_score": float(qags_scores.mean()),
+            "triple_score": float(triple_scores.mean()),
+            "rouge": tuple(rouge),
             "bert_score": {
-                "precision": bert_scores[0],
-                "recall": bert_scores[1],
-                "f1": bert_scores[2],
+                "precision": bert_score[0],
+                "recall": bert_score[1],
+                "f1": bert_score[2],
             },
         }
@@ -0,0 +1,34 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def lcs_length(a: np.ndarray, b: np.ndarray) -> int:
+    """
+    Calculate the length of the Longest Common Subsequence of two int-encoded token arrays
+
+    Args:
+        a (np.ndarray): first int32 token id array
+        b (np.ndarray): second int32 token id array
+
+    Returns:
+        int: LCS length
+
+    """
+    if a.shape[0] < b.shape[0]:
+        a, b = b, a
+
+    # single DP row over the shorter sequence keeps memory O(min(n, m))
+    row = np.zeros(b.shape[0] + 1, dtype=np.int32)
+
+    for i in range(a.shape[0]):
+        upper_left = 0
+        for j in range(1, b.shape[0] + 1):
+            up = row[j]
+            if a[i] == b[j - 1]:
+                row[j] = upper_left + 1
+            else:
+                row[j] = max(row[j - 1], up)
+            upper_left = up
+
+    return row[b.shape[0]]
@@ -1,21 +1,31 @@
 from typing import List, Tuple
 
+import torch
 from flair.data import Sentence
 from flair.models import SequenceTagger
 from requests import HTTPError
 from rich import print
 from transformers import LukeForEntityPairClassification, LukeTokenizer, pipeline
 
-from factsumm.utils.utils import grouped_entities
+from factsumm.utils.utils import compile_forward, grouped_entities
 
 
-def load_ner(model: str, device: str) -> object:
+def load_ner(
+    model: str,
+    device: str,
+    batch_size: int = 32,
+    dtype: torch.dtype = torch.float32,
+    compile_model: bool = False,
+) -> object:
     """
     Load Named Entity Recognition model from HuggingFace hub
 
     Args:
         model (str): model name to be loaded
         device (str): device info
+        batch_size (int, optional): number of sentences per forward pass. Defaults to 32.
+        dtype (torch.dtype, optional): HuggingFace model precision. Defaults to torch.float32.
+        compile_model (bool, optional): compile HuggingFace model with `torch.compile`. Defaults to False.
 
     Returns:
         object: Pipeline-based Named Entity Recognition model
@@ -29,13 +39,14 @@ def load_ner(model: str, device: str) -> object:
         except UnboundLocalError:
             print("Input model is not supported by Flair")
 
+        @torch.inference_mode()
         def extract_entities_flair(sentences: List[str]):
             result = list()
 
-            for sentence in sentences:
-                sentence = Sentence(sentence)
-                ner.predict(sentence)
+            sentences = [Sentence(sentence) for sentence in sentences]
+            ner.predict(sentences, mini_batch_size=batch_size)
 
+            for sentence in sentences:
                 cache = dict()
                 dedup = list()
 
@@ -65,10 +76,16 @@ def load_ner(model: str, device: str) -> object:
                 ignore_labels=[],
                 framework="pt",
                 device=-1 if device == "cpu" else 0,
+                batch_size=batch_size,
             )
+            ner.model.to(dtype=dtype)
+
+            if compile_model:
+                compile_forward(ner.model)
         except (HTTPError, OSError):
             print("Input model is not supported by HuggingFace Hub")
 
+        @torch.inference_mode()
         def extract_entities_hf(sentences: List[str]):
             result = list()
             total_entities = ner(sentences)
@@ -84,13 +101,22 @@ def load_ner(model: str, device: str) -> object:
         return extract_entities_hf
 
 
-def load_rel(model: str, device: str):
+def load_rel(
+    model: str,
+    device: str,
+    batch_size: int = 32,
+    dtype: torch.dtype = torch.float32,
+    compile_model: bool = False,
+):
     """
     Load LUKE for Relation Extraction model and return its applicable function
 
     Args:
         model (str): model name to be loaded
         device (str): device info
+        batch_size (int, optional): number of entity pairs per forward pass. Defaults to 32.
+        dtype (torch.dtype, optional): model precision. Defaults to torch.float32.
+        compile_model (bool, optional): compile model with `torch.compile`. Defaults to False.
 
     Returns:
         function: LUKE-based Relation Extraction function
@@ -101,19 +127,21 @@ def load_rel(model: str, device: str):
     try:
         # yapf:disable
         tokenizer = LukeTokenizer.from_pretrained(model)
-        model = LukeForEntityPairClassification.from_pretrained(model).to(device)
+        model = LukeForEntityPairClassification.from_pretrained(model).to(device, dtype=dtype)
         # yapf:enable
     except (HTTPError, OSError):
         print("Input model is not supported by HuggingFace Hub")
 
+    if compile_model:
+        compile_forward(model)
+
+    @torch.inference_mode()
     def extract_relation(sentences: List) -> List[Tuple]:
         """
         Extraction Relation based on Entity Information
 
         Args:
-            sentence (str): original sentence containing context
-            head_entity (Dict): head entity containing position information
-            tail_entity (Dict): tail entity containing position information
+            sentences (List): list of sentences containing context and (head, tail) entity spans
 
         Returns:
             List[Tuple]: list of (head_entity, relation, tail_entity) formatted triples
@@ -121,28 +149,32 @@ def load_rel(model: str, device: str):
         """
         triples = list()
 
-        # TODO: batchify
-        for sentence in sentences:
+        for i in range(0, len(sentences), batch_size):
+            batch = sentences[i:i + batch_size]
+
             tokens = tokenizer(
-                sentence["text"],
-                entity_spans=[
+                [sentence["text"] for sentence in batch],
+                entity_spans=[[
                     (sentence["spans"][0][0], sentence["spans"][0][-1]),
                     (sentence["spans"][-1][0], sentence["spans"][-1][-1]),
-                ],
+                ] for sentence in batch],
+                padding=True,
                 return_tensors="pt",
             ).to(device)
             outputs = model(**tokens)
-            predicted_id = int(outputs.logits[0].argmax())
-            relation = model.config.id2label[predicted_id]
-
-            if relation != "no_relation":
-                triples.append((
-                    sentence["text"]
-                    [sentence["spans"][0][0]:sentence["spans"][0][-1]],
-                    relation,
-                    sentence["text"]
-                    [sentence["spans"][-1][0]:sentence["spans"][-1][-1]],
-                ))
+            predicted_ids = outputs.logits.argmax(-1).tolist()
+
+            for sentence, predicted_id in zip(batch, predicted_ids):
+                relation = model.config.id2label[predicted_id]
+
+                if relation != "no_relation":
+                    triples.append((
+                        sentence["text"]
+                        [sentence["spans"][0][0]:sentence["spans"][0][-1]],
+                        relation,
+                        sentence["text"]
+                        [sentence["spans"][-1][0]:sentence["spans"][-1][-1]],
+                    ))
 
         return triples
 
@@ -1,17 +1,29 @@
-from typing import List
+from typing import Callable, Dict, List
 
+import torch
 from requests import HTTPError
 from rich import print
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
+from factsumm.utils.utils import compile_forward
 
-def load_qg(model: str, device: str):
+
+def load_qg(
+    model: str,
+    device: str,
+    batch_size: int = 32,
+    dtype: torch.dtype = torch.float32,
+    compile_model: bool = False,
+):
     """
     Load Question Generation model from HuggingFace hub
 
     Args:
         model (str): model name to be loaded
         device (str): device info
+        batch_size (int, optional): number of questions generated per forward pass. Defaults to 32.
+        dtype (torch.dtype, optional): model precision. Defaults to torch.float32.
+        compile_model (bool, optional): compile model with `torch.compile`. Defaults to False.
 
     Returns:
         function: question generation function
@@ -21,10 +33,14 @@ def load_qg(model: str, device: str):
 
     try:
         tokenizer = AutoTokenizer.from_pretrained(model)
-        model = AutoModelForSeq2SeqLM.from_pretrained(model).to(device)
+        model = AutoModelForSeq2SeqLM.from_pretrained(model).to(device, dtype=dtype)
     except (HTTPError, OSError):
         print("Input model is not supported by HuggingFace Hub")
 
+    if compile_model:
+        compile_forward(model)
+
+    @torch.inference_mode()
     def generate_question(sentences: List[str], total_entities: List):
         """
         Generation question using context and entity information
@@ -37,32 +53,39 @@ def load_qg(model: str, device: str):
             List[Dict] list of question and answer (entity) pairs
 
         """
-        qa_pairs = list()
+        answers = list()
+        templates = list()
 
         for sentence, line_entities in zip(sentences, total_entities):
             for entity in line_entities:
                 entity = entity["word"]
 
-                template = f"answer: {entity}  context: {sentence} </s>"
+                answers.append(entity)
+                templates.append(f"answer: {entity}  context: {sentence} </s>")
+
+        qa_pairs = list()
 
-                # TODO: batchify
-                tokens = tokenizer(
-                    template,
-                    padding="max_length",
-                    max_length=512,
-                    truncation=True,
-                    return_tensors="pt",
-                ).to(device)
+        # tokenize each batch of templates in one call, padded only up to its longest template
+        for i in range(0, len(templates), batch_size):
+            tokens = tokenizer(
+                templates[i:i + batch_size],
+                padding=True,
+                max_length=512,
+                truncation=True,
+                return_tensors="pt",
+            ).to(device)
 
-                outputs = model.generate(**tokens, max_length=64)
+            outputs = model.generate(**tokens, max_length=64)
+            questions = tokenizer.batch_decode(outputs, skip_special_tokens=True)
 
-                question = tokenizer.decode(outputs[0])
-                question = question.replace("</s>", "")
-                question = question.replace("<pad> question: ", "")
+            for answer, question in zip(answers[i:i + batch_size], questions):
+                question = question.strip()
+                if question.startswith("question: "):
+                    question = question[len("question: "):]
 
                 qa_pairs.append({
                     "question": question,
-                    "answer": entity,
+                    "answer": answer,
                 })
 
         return qa_pairs
@@ -70,13 +93,62 @@ def load_qg(model: str, device: str):
     return generate_question
 
 
-def load_qa(model: str, device: str):
+def answer_questions(qa: Callable, contexts: List[str], qa_pairs: List) -> List[Dict]:
+    """
+    Answer each question against its own context with a single batched call of `qa`
+
+    Args:
+        qa (Callable): question answering pipeline
+        contexts (List[str]): context to be encoded for each question
+        qa_pairs (List): Question & Answer pairs generated from Question Generation pipe
+
+    Returns:
+        List[Dict]: answers aligned with `qa_pairs`
+
+    """
+    # identical (question, context) inputs encode identically, so answer each only once
+    inputs = list(dict.fromkeys((qa_pair["question"], context) for qa_pair, context in zip(qa_pairs, contexts)))
+    preds = list()
+
+    if inputs:
+        preds = qa(
+            question=[question for question, _ in inputs],
+            context=[context for _, context in inputs],
+            handle_impossible_answer=True,
+        )
+
+        # pipeline returns a bare dict for a single input
+        if isinstance(preds, dict):
+            preds = [preds]
+
+    preds = {
+        key: pred["answer"] if pred["answer"] != "" else "<unanswerable>"
+        for key, pred in zip(inputs, preds)
+    }
+
+    return [{
+        "question": qa_pair["question"],
+        "answer": qa_pair["answer"],
+        "prediction": preds[qa_pair["question"], context],
+    } for qa_pair, context in zip(qa_pairs, contexts)]
+
+
+def load_qa(
+    model: str,
+    device: str,
+    batch_size: int = 32,
+    dtype: torch.dtype = torch.float32,
+    compile_model: bool = False,
+):
     """
     Load Question Answering model from HuggingFace hub
 
     Args:
         model (str): model name to be loaded
         device (str): device info
+        batch_size (int, optional): number of (question, context) pairs per forward pass. Defaults to 32.
+        dtype (torch.dtype, optional): model precision. Defaults to torch.float32.
+        compile_model (bool, optional): compile model with `torch.compile`. Defaults to False.
 
     Returns:
         function: question answering function
@@ -91,31 +163,28 @@ def load_qa(model: str, device: str):
             tokenizer=model,
             framework="pt",
             device=-1 if device == "cpu" else 0,
+            batch_size=batch_size,
         )
+        qa.model.to(dtype=dtype)
+
+        if compile_model:
+            compile_forward(qa.model)
     except (HTTPError, OSError):
         print("Input model is not supported by HuggingFace Hub")
 
-    def answer_question(context: str, qa_pairs: List):
+    @torch.inference_mode()
+    def answer_question(contexts: List[str], qa_pairs: List) -> List[Dict]:
         """
         Answer question via Span Prediction
 
         Args:
-            context (str): context to be encoded
+            contexts (List[str]): context to be encoded for each question
             qa_pairs (List): Question & Answer pairs generated from Question Generation pipe
 
+        Returns:
+            List[Dict]: answers aligned with `qa_pairs`
+
         """
-        answers = list()
-        for qa_pair in qa_pairs:
-            pred = qa(
-                question=qa_pair["question"],
-                context=context,
-                handle_impossible_answer=True,
-            )["answer"]
-            answers.append({
-                "question": qa_pair["question"],
-                "answer": qa_pair["answer"],
-                "prediction": pred if pred != "" else "<unanswerable>"
-            })
-        return answers
+        return answer_questions(qa, contexts, qa_pairs)
 
     return answer_question
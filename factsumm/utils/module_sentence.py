@@ -1,3 +1,6 @@
+from typing import List, Tuple
+
+import torch
 from bert_score import BERTScorer
 from rich import print
 
@@ -11,7 +14,7 @@ def load_bert_score(model: str, device: str):
         device (str): device info
 
     Returns:
-        function: BERTScore score function
+        function: BERTScore scoring function
 
     """
     print("Loading BERTScore Pipeline...")
@@ -23,6 +26,25 @@ def load_bert_score(model: str, device: str):
             rescale_with_baseline=True,
             device=device,
         )
-        return scorer.score
     except KeyError:
         print("Input model is not supported by BERTScore")
+
+    @torch.inference_mode()
+    def score(summaries: List[str], total_source_lines: List[List[str]]) -> Tuple[List[float], ...]:
+        """
+        Score each summary against the lines of its own source
+
+        Args:
+            summaries (List[str]): list of generated summaries
+            total_source_lines (List[List[str]]): list of segmented source lines per summary
+
+        Returns:
+            Tuple[List[float], ...]: per-summary (Precision, Recall, F1) lists
+
+        """
+        # multi-reference input lets BERTScore pair each summary with every source line itself,
+        # so single-line inputs never hit a batch shape mismatch; the best matching line is kept
+        precision, recall, f1 = scorer.score(summaries, total_source_lines)
+        return precision.tolist(), recall.tolist(), f1.tolist()
+
+    return score
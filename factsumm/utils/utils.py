@@ -2,8 +2,11 @@ import re
 import string
 from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
 
+import numpy as np
+import torch
 from transformers import pipeline
 
 
@@ -17,6 +20,51 @@ class Config:
     BERT_SCORE_MODEL: str = "microsoft/deberta-base-mnli"
 
 
+def get_torch_dtype(
+    device: str,
+    half_precision: bool = False,
+    allow_bfloat16: bool = True,
+) -> torch.dtype:
+    """
+    Select model precision for the given device
+
+    Args:
+        device (str): device info
+        half_precision (bool, optional): use half precision on CUDA devices. Defaults to False.
+        allow_bfloat16 (bool, optional): allow bfloat16 on Ampere or newer GPUs. Defaults to True.
+
+    Returns:
+        torch.dtype: bfloat16 on Ampere or newer GPUs (if allowed), float16 on other GPUs, float32 otherwise
+
+    """
+    if not half_precision or not device.startswith("cuda"):
+        return torch.float32
+
+    major, _ = torch.cuda.get_device_capability(device)
+    return torch.bfloat16 if allow_bfloat16 and major >= 8 else torch.float16
+
+
+def compile_forward(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Compile forward pass of the model with `torch.compile` to cut per-kernel launch overhead
+
+        `forward` is compiled instead of the module itself so that methods like `generate` use it too
+
+    Args:
+        model (torch.nn.Module): model to be compiled
+
+    Returns:
+        torch.nn.Module: model whose forward pass is compiled
+
+    """
+    if not hasattr(torch, "compile"):
+        raise RuntimeError(f"Compiling models requires torch>=2.0, but torch=={torch.__version__} is installed")
+
+    model.eval()
+    model.forward = torch.compile(model.forward, mode="reduce-overhead", dynamic=True)
+    return model
+
+
 def grouped_entities(entities: List[Dict]) -> List:
     """
     Group entities to concatenate BIO
@@ -100,6 +148,28 @@ def grouped_entities(entities: List[Dict]) -> List:
     return dedup
 
 
+def split_by_lengths(items: List, lengths: List[int]) -> List[List]:
+    """
+    Split flattened batch outputs back into consecutive chunks of given lengths
+
+    Args:
+        items (List): flattened list of items
+        lengths (List[int]): length of each chunk
+
+    Returns:
+        List[List]: list of chunks
+
+    """
+    chunks = list()
+    offset = 0
+
+    for length in lengths:
+        chunks.append(items[offset:offset + length])
+        offset += length
+
+    return chunks
+
+
 def load_summarizer(model: str) -> object:
     """
     Load Summarization model from HuggingFace hub
@@ -186,3 +256,127 @@ def qags_score(source_answers: List, summary_answers: List) -> float:
     if not scores:
         return 0.0
     return sum(scores) / len(scores)
+
+
+def _rouge_f1(matches: int, count_for_recall: int, count_for_precision: int) -> float:
+    recall = matches / count_for_recall if count_for_recall else 0.0
+    precision = matches / count_for_precision if count_for_precision else 0.0
+
+    if precision + recall == 0:
+        return 0.0
+    return 2 * precision * recall / (precision + recall)
+
+
+def _count_ngrams(tokens: Sequence[str], n: int) -> Counter:
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def rouge_n_score(summary_tokens: Sequence[str], total_source_tokens: List[Sequence[str]], n: int) -> float:
+    """
+    Calculate ROUGE-N F1 score of a tokenized summary against tokenized source lines
+
+        See also https://github.com/chakki-works/sumeval/blob/master/sumeval/metrics/rouge.py
+
+    Args:
+        summary_tokens (Sequence[str]): tokens of generated summary
+        total_source_tokens (List[Sequence[str]]): tokens of each source line
+        n (int): n-gram size
+
+    Returns:
+        float: ROUGE-N score
+
+    """
+    summary_ngrams = _count_ngrams(summary_tokens, n)
+
+    matches = 0
+    count_for_recall = 0
+
+    for source_tokens in total_source_tokens:
+        matches += sum((summary_ngrams & _count_ngrams(source_tokens, n)).values())
+        count_for_recall += max(len(source_tokens) - n + 1, 0)
+
+    count_for_precision = len(total_source_tokens) * max(len(summary_tokens) - n + 1, 0)
+    return _rouge_f1(matches, count_for_recall, count_for_precision)
+
+
+def lcs_length(a: Sequence[str], b: Sequence[str]) -> int:
+    """
+    Calculate the length of the Longest Common Subsequence using a single DP row
+
+    Args:
+        a (Sequence[str]): first token sequence
+        b (Sequence[str]): second token sequence
+
+    Returns:
+        int: LCS length
+
+    """
+    if len(a) < len(b):
+        a, b = b, a
+
+    row = [0] * (len(b) + 1)
+
+    for token_a in a:
+        upper_left = 0
+        for j, token_b in enumerate(b, 1):
+            up = row[j]
+            row[j] = upper_left + 1 if token_a == token_b else max(row[j - 1], up)
+            upper_left = up
+
+    return row[-1]
+
+
+@lru_cache(maxsize=None)
+def _load_numba_lcs() -> Optional[Callable]:
+    """
+    Lazily import the Numba-compiled LCS, which is only available when `numba` is installed
+
+    Returns:
+        Optional[Callable]: compiled LCS function or None
+
+    """
+    try:
+        from factsumm.utils._rouge_numba import lcs_length as numba_lcs_length
+    except ImportError:
+        return None
+    return numba_lcs_length
+
+
+def rouge_l_score(summary_tokens: Sequence[str], total_source_tokens: List[Sequence[str]]) -> float:
+    """
+    Calculate ROUGE-L F1 score of a tokenized summary against tokenized source lines
+
+        See also https://github.com/chakki-works/sumeval/blob/master/sumeval/metrics/rouge.py
+
+    Args:
+        summary_tokens (Sequence[str]): tokens of generated summary
+        total_source_tokens (List[Sequence[str]]): tokens of each source line
+
+    Returns:
+        float: ROUGE-L score
+
+    """
+    matches = 0
+    count_for_recall = 0
+
+    numba_lcs_length = _load_numba_lcs()
+
+    if numba_lcs_length is None:
+        for source_tokens in total_source_tokens:
+            matches += lcs_length(source_tokens, summary_tokens)
+            count_for_recall += len(source_tokens)
+    else:
+        # the compiled LCS works on int ids, so encode every token with a shared vocabulary
+        vocab = dict()
+
+        def _encode(tokens: Sequence[str]) -> np.ndarray:
+            return np.array([vocab.setdefault(token, len(vocab)) for token in tokens], dtype=np.int32)
+
+        summary_ids = _encode(summary_tokens)
+
+        for source_tokens in total_source_tokens:
+            matches += int(numba_lcs_length(_encode(source_tokens), summary_ids))
+            count_for_recall += len(source_tokens)
+
+    count_for_precision = len(total_source_tokens) * len(summary_tokens)
+    return _rouge_f1(matches, count_for_recall, count_for_precision)
@@ -1,7 +1,9 @@
 from setuptools import setup, find_packages
 
 requirements = [
-    "transformers>=4.6.0",
+    "torch",
+    "transformers>=4.12.0",
+    "numpy",
     "pysbd",
     "bert-score",
     "dataclasses; python_version<'3.7'",
@@ -34,5 +36,5 @@ setup(
     packages=find_packages(include=["factsumm", "factsumm.*"]),
     install_requires=requirements,
     python_requires=">=3.6.0",
-    extras_require={},
+    extras_require={"numba": ["numba"]},
 )
@@ -1,9 +1,79 @@
+import re
 import unittest
 
 from factsumm import FactSumm
 from factsumm.utils.utils import Config, load_summarizer
 
 
+# lightweight stand-ins for the NER, RE, QG, QA, BERTScore and OpenIE models
+def _stub_ner(lines):
+    return [
+        [
+            {"word": match.group(), "entity": "ENT", "start": match.start(), "end": match.end()}
+            for match in re.finditer(r"[A-Z]\w+", line)
+        ]
+        for line in lines
+    ]
+
+
+def _stub_rel(sentences):
+    triples = list()
+    for sentence in sentences:
+        (head_start, head_end), (tail_start, tail_end) = sentence["spans"]
+        relation = "before" if head_start < tail_start else "after"
+        triples.append((sentence["text"][head_start:head_end], relation, sentence["text"][tail_start:tail_end]))
+    return triples
+
+
+def _stub_qg(lines, total_entities):
+    return [
+        {"question": f"Who is {entity['word']}?", "answer": entity["word"]}
+        for entities in total_entities
+        for entity in entities
+    ]
+
+
+def _stub_qa(contexts, qa_pairs):
+    return [
+        {
+            "question": qa_pair["question"],
+            "answer": qa_pair["answer"],
+            "prediction": qa_pair["answer"] if qa_pair["answer"] in context else "<unanswerable>",
+        }
+        for context, qa_pair in zip(contexts, qa_pairs)
+    ]
+
+
+def _stub_bert_score(summaries, total_source_lines):
+    precisions = [len(summary) / 100 for summary in summaries]
+    recalls = [1 / len(source_lines) for source_lines in total_source_lines]
+    f1s = [p * r for p, r in zip(precisions, recalls)]
+    return precisions, recalls, f1s
+
+
+def _stub_ie(text):
+    return [
+        {"subject": words[0], "relation": "with", "object": words[-1]}
+        for words in (re.findall(r"[A-Z]\w+", sentence) for sentence in text.split("."))
+        if words
+    ]
+
+
+def _stub_factsumm(**models):
+    stubs = dict(
+        ner_model=_stub_ner,
+        rel_model=_stub_rel,
+        qg_model=_stub_qg,
+        qa_model=_stub_qa,
+        bert_score_model=_stub_bert_score,
+    )
+    stubs.update(models)
+
+    factsumm = FactSumm(**stubs)
+    factsumm.ie = _stub_ie
+    return factsumm
+
+
 class TestFactSum(unittest.TestCase):
 
     def test_whole_pipes(self):
@@ -17,6 +87,150 @@ class TestFactSum(unittest.TestCase):
 
         factsumm(article, summary)
 
+    def test_build_perm(self):
+        factsumm = FactSumm()
+
+        line = "Messi plays for Barcelona in Spain."
+        entities = [
+            {"word": "Messi", "entity": "PERSON", "start": 0, "end": 5},
+            {"word": "Barcelona", "entity": "ORG", "start": 16, "end": 25},
+            {"word": "Spain", "entity": "GPE", "start": 29, "end": 34},
+        ]
+
+        perms = factsumm.build_perm([line, line, line], [entities, entities[:1], []])
+
+        self.assertEqual(
+            [perm["spans"] for perm in perms[0]],
+            [
+                [(0, 5), (16, 25)],
+                [(0, 5), (29, 34)],
+                [(16, 25), (0, 5)],
+                [(16, 25), (29, 34)],
+                [(29, 34), (0, 5)],
+                [(29, 34), (16, 25)],
+            ],
+        )
+        self.assertTrue(all(perm["text"] == line for perm in perms[0]))
+        self.assertEqual(perms[1:], [[], []])
+
+    def test_filter_out(self):
+        factsumm = FactSumm()
+
+        sources = {
+            ("Messi", "plays_for", "Barcelona"),
+            ("Messi", "born_in", "Rosario"),
+            ("Barcelona", "located_in", "Spain"),
+        }
+        summaries = {
+            ("Messi", "plays_for", "Madrid"),
+            ("Messi", "nationality", "Spanish"),
+        }
+
+        self.assertEqual(
+            factsumm._filter_out(sources, summaries),
+            ({("Messi", "plays_for", "Barcelona")}, {("Messi", "plays_for", "Madrid")}),
+        )
+        self.assertEqual(factsumm._filter_out(sources, set()), (set(), set()))
+
+    def test_get_facts(self):
+        calls = list()
+
+        def rel(sentences):
+            calls.append(len(sentences))
+            return _stub_rel(sentences)
+
+        factsumm = _stub_factsumm(rel_model=rel)
+
+        lines = ["Messi joined Barcelona from Rosario.", "Messi scored.", "Barcelona beat Madrid."]
+        facts = factsumm.get_facts(lines, _stub_ner(lines))
+
+        # entity pairs of every line are classified in one RE call; single-entity lines add none
+        self.assertEqual(calls, [6 + 0 + 2])
+        self.assertIn(("Messi", "before", "Barcelona"), facts)
+        self.assertIn(("Madrid", "after", "Barcelona"), facts)
+        self.assertEqual(len(facts), 8)
+
+        # without any entity pair the RE model is not called at all
+        self.assertEqual(factsumm.get_facts(lines[1:2], _stub_ner(lines[1:2])), set())
+        self.assertEqual(calls, [8])
+
+    def test_extract_triples_skips_source(self):
+        annotated = list()
+
+        def ie(text):
+            annotated.append(text)
+            return _stub_ie(text)
+
+        factsumm = _stub_factsumm()
+        factsumm.ie = ie
+
+        source = "Messi plays for Barcelona. Messi was born in Rosario."
+
+        # a summary without triples cannot match anything, so the source is never annotated
+        self.assertEqual(factsumm.extract_triples(source, "the player moved abroad."), 0.0)
+        self.assertEqual(annotated, ["the player moved abroad."])
+
+        annotated.clear()
+        self.assertEqual(factsumm.extract_triples(source, "Messi left Barcelona."), 1.0)
+        self.assertEqual(annotated, ["Messi left Barcelona.", source])
+
+    def test_segment_cache(self):
+        factsumm = FactSumm()
+        factsumm._segment_cache_size = 2
+
+        self.assertEqual(factsumm._segment("First line. Second line."), ["First line.", "Second line."])
+        factsumm._segment("Third line.")
+        factsumm._segment("Fourth line.")
+
+        # the oldest entry is evicted first once the cache is full
+        self.assertEqual(list(factsumm._segment_cache), ["Third line.", "Fourth line."])
+
+        # returned lines are copies, so callers cannot corrupt the cache
+        lines = factsumm._segment("Fourth line.")
+        lines.append("mutated")
+        self.assertEqual(factsumm._segment("Fourth line."), ["Fourth line."])
+
+    def test_batched_call(self):
+        sources = [
+            "Messi plays for Barcelona. Messi was born in Rosario.",
+            "Messi plays for Barcelona. Messi was born in Rosario.",
+            "Ronaldo left Lisbon for Madrid. Ronaldo won the league.",
+        ]
+        summaries = [
+            "Messi plays for Madrid.",
+            "the player moved abroad.",
+            "Ronaldo joined Madrid. Lisbon sold Ronaldo.",
+        ]
+
+        qa_calls = list()
+
+        def qa(contexts, qa_pairs):
+            qa_calls.append(len(qa_pairs))
+            return _stub_qa(contexts, qa_pairs)
+
+        scores = _stub_factsumm(qa_model=qa)(sources, summaries)
+
+        # every question of every pair is answered against both contexts in a single QA call
+        self.assertEqual(qa_calls, [2 * (2 + 0 + 4)])
+
+        factsumm = _stub_factsumm()
+        pair_scores = [factsumm(source, summary) for source, summary in zip(sources, summaries)]
+
+        for key in ("fact_score", "qa_score", "triple_score"):
+            self.assertAlmostEqual(scores[key], sum(pair[key] for pair in pair_scores) / len(pair_scores))
+
+        for i in range(3):
+            self.assertAlmostEqual(
+                scores["rouge"][i],
+                sum(pair["rouge"][i] for pair in pair_scores) / len(pair_scores),
+            )
+
+        for key in ("precision", "recall", "f1"):
+            self.assertAlmostEqual(
+                scores["bert_score"][key],
+                sum(pair["bert_score"][key] for pair in pair_scores) / len(pair_scores),
+            )
+
 
 if __name__ == "__main__":
     config = Config()
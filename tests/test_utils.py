@@ -1,8 +1,10 @@
 import unittest
 
+from sumeval.metrics.rouge import RougeCalculator
 from transformers import pipelines
 
-from factsumm.utils.utils import Config, grouped_entities
+from factsumm.utils.module_question import answer_questions
+from factsumm.utils.utils import Config, grouped_entities, rouge_l_score, rouge_n_score, split_by_lengths
 
 
 class TestUtils(unittest.TestCase):
@@ -22,3 +24,69 @@ class TestUtils(unittest.TestCase):
         entities = ner(article)
 
         grouped = grouped_entities(entities)
+
+    def test_rouge_scores(self):
+        rouge = RougeCalculator(stopwords=True, lang="en")
+
+        source_lines = [
+            "Lionel Andrés Messi is an Argentine professional footballer.",
+            "He plays as a forward and captains both Spanish club Barcelona and the Argentina national team.",
+        ]
+        summary = "Lionel Andrés Messi is a Spanish footballer who captains Barcelona."
+
+        summary_tokens = rouge.tokenize(summary)
+        source_tokens = [rouge.tokenize(line, True) for line in source_lines]
+
+        self.assertAlmostEqual(rouge_n_score(summary_tokens, source_tokens, 1), rouge.rouge_n(summary, source_lines, 1))
+        self.assertAlmostEqual(rouge_n_score(summary_tokens, source_tokens, 2), rouge.rouge_n(summary, source_lines, 2))
+        self.assertAlmostEqual(rouge_l_score(summary_tokens, source_tokens), rouge.rouge_l(summary, source_lines))
+
+    def test_answer_questions(self):
+        calls = list()
+
+        def qa(question, context, handle_impossible_answer):
+            calls.append(list(zip(question, context)))
+            preds = [{"answer": "" if q == "Who?" else f"{q}@{c}"} for q, c in zip(question, context)]
+            return preds[0] if len(preds) == 1 else preds
+
+        qa_pairs = [
+            {"question": "Where?", "answer": "Barcelona"},
+            {"question": "Who?", "answer": "Messi"},
+            {"question": "Where?", "answer": "Spain"},
+        ]
+        contexts = ["source", "source", "source"]
+
+        answers = answer_questions(qa, contexts + ["summary"] * 3, qa_pairs + qa_pairs)
+
+        # duplicated (question, context) inputs are answered only once, in a single call
+        self.assertEqual(calls, [[
+            ("Where?", "source"),
+            ("Who?", "source"),
+            ("Where?", "summary"),
+            ("Who?", "summary"),
+        ]])
+        self.assertEqual(
+            [answer["prediction"] for answer in answers],
+            [
+                "Where?@source",
+                "<unanswerable>",
+                "Where?@source",
+                "Where?@summary",
+                "<unanswerable>",
+                "Where?@summary",
+            ],
+        )
+        self.assertEqual([answer["answer"] for answer in answers[:3]], ["Barcelona", "Messi", "Spain"])
+
+        # a single input comes back from the pipeline as a bare dict
+        answers = answer_questions(qa, ["source"], qa_pairs[:1])
+        self.assertEqual(answers[0]["prediction"], "Where?@source")
+
+        self.assertEqual(answer_questions(qa, [], []), [])
+
+    def test_split_by_lengths(self):
+        self.assertEqual(
+            split_by_lengths([1, 2, 3, 4, 5, 6], [2, 0, 3, 1]),
+            [[1, 2], [], [3, 4, 5], [6]],
+        )
+        self.assertEqual(split_by_lengths([], [0, 0]), [[], []])